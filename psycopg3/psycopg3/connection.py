@@ -8,8 +8,8 @@ import logging
 import asyncio
 import threading
 from types import TracebackType
-from typing import Any, AsyncIterator, Callable, Iterator, List, NamedTuple
-from typing import Optional, Type, cast
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List
+from typing import NamedTuple, Optional, Type, cast
 from weakref import ref, ReferenceType
 from functools import partial
 
@@ -92,6 +92,9 @@ class BaseConnection:
         self._notice_handlers: List[NoticeHandler] = []
         self._notify_handlers: List[NotifyHandler] = []
 
+        # cache of the server parameters, reset at every query
+        self._param_status: Dict[bytes, Optional[bytes]] = {}
+
         wself = ref(self)
 
         pgconn.notice_handler = partial(BaseConnection._notice_handler, wself)
@@ -142,6 +145,23 @@ class BaseConnection:
     def _set_client_encoding(self, name: str) -> None:
         raise NotImplementedError
 
+    def _parameter_status(self, name: bytes) -> Optional[bytes]:
+        """
+        Return the value of a server parameter, caching it.
+
+        The cache is reset at every query and transaction end, as any command
+        might change the parameters (not only SET but also RESET, ROLLBACK,
+        functions...), so it only saves the call to the libpq when several
+        adapters are created for the same query.
+        """
+        try:
+            return self._param_status[name]
+        except KeyError:
+            pass
+
+        rv = self._param_status[name] = self.pgconn.parameter_status(name)
+        return rv
+
     def cancel(self) -> None:
         """Cancel the current operation on the connection."""
         c = self.pgconn.get_cancel()
@@ -262,6 +282,7 @@ class Connection(BaseConnection):
 
     def _start_query(self) -> None:
         # the function is meant to be called by a cursor once the lock is taken
+        self._param_status.clear()
         if self._autocommit:
             return
 
@@ -288,6 +309,7 @@ class Connection(BaseConnection):
 
     def _exec_commit_rollback(self, command: bytes) -> None:
         # Caller must hold self.lock
+        self._param_status.clear()
         status = self.pgconn.transaction_status
         if status == TransactionStatus.IDLE:
             return
@@ -391,6 +413,7 @@ class AsyncConnection(BaseConnection):
 
     async def _start_query(self) -> None:
         # the function is meant to be called by a cursor once the lock is taken
+        self._param_status.clear()
         if self._autocommit:
             return
 
@@ -415,6 +438,7 @@ class AsyncConnection(BaseConnection):
 
     async def _exec_commit_rollback(self, command: bytes) -> None:
         # Caller must hold self.lock
+        self._param_status.clear()
         status = self.pgconn.transaction_status
         if status == TransactionStatus.IDLE:
             return
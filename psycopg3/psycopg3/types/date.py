@@ -6,14 +6,100 @@ Adapters for date/time types.
 
 import re
 import sys
-from datetime import date, datetime, time, timedelta
-from typing import cast
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, cast, Dict, Match, Optional, Pattern, Tuple, Type
+from functools import lru_cache
 
 from ..oids import builtins
 from ..adapt import Dumper, Loader
 from ..proto import AdaptContext
 from ..errors import InterfaceError, DataError
 
+# Regexp equivalent to the strptime directives used in the formats below
+_re_directives = {
+    "%Y": r"(?P<Y>\d{4})",
+    "%m": r"(?P<m>0[1-9]|1[0-2])",
+    "%b": r"(?P<m>Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)",
+    "%d": r"(?P<d>\d{2})",
+    "%a": r"[A-Z][a-z]{2}",
+    "%H": r"(?P<H>\d{2})",
+    "%M": r"(?P<M>\d{2})",
+    "%S": r"(?P<S>\d{2})",
+    ".%f": r"(?:\.(?P<f>\d{1,6}))?",
+    "%z": r"(?P<z>[-+]\d{2}(?::?\d{2}){0,2})",
+}
+
+# Map the month matched by the regexps to its number
+_month_ids = {
+    b"Jan": 1,
+    b"Feb": 2,
+    b"Mar": 3,
+    b"Apr": 4,
+    b"May": 5,
+    b"Jun": 6,
+    b"Jul": 7,
+    b"Aug": 8,
+    b"Sep": 9,
+    b"Oct": 10,
+    b"Nov": 11,
+    b"Dec": 12,
+}
+_month_ids.update((b"%02d" % i, i) for i in range(1, 13))
+
+
+def _re_from_format(fmt: str) -> Pattern[bytes]:
+    """
+    Return a regexp matching the same strings of a strptime format.
+
+    The regexp exposes the parsed fields as named groups, after the name of
+    the strptime directive (e.g. "%Y" -> "Y"), so that the values can be
+    converted without going through the much slower `datetime.strptime()`.
+    """
+    parts = [
+        _re_directives.get(tok) or re.escape(tok)
+        for tok in re.findall(r"\.%f|%.|.", fmt)
+    ]
+    parts.append("$")
+    return re.compile("".join(parts).encode("ascii"))
+
+
+_timezones: Dict[bytes, timezone] = {}
+
+# Python 3.6 doesn't support seconds in the UTC offsets: they are dropped
+_tz_digits = 6 if sys.version_info >= (3, 7) else 4
+
+_re_offset = re.compile(br"[-+]\d{2}(?::?\d{2}){0,2}")
+
+
+def _timezone_from_offset(s: bytes) -> timezone:
+    """
+    Return a timezone from an UTC offset such as +HH, -HH:MM, +HH:MM:SS.
+    """
+    try:
+        return _timezones[s]
+    except KeyError:
+        pass
+
+    # Make sure there is nothing else, e.g. the " BC" of a timestamp
+    if not _re_offset.fullmatch(s):
+        raise ValueError(f"bad UTC offset: {s.decode('utf8', 'replace')}")
+
+    digits = s[1:].replace(b":", b"")
+    off = timedelta(
+        hours=int(digits[:2]),
+        minutes=int(digits[2:4] or b"0"),
+        seconds=int(digits[4:_tz_digits] or b"0"),
+    )
+    if s.startswith(b"-"):
+        off = -off
+
+    rv = _timezones[s] = timezone(off)
+    return rv
+
+
+# The chars a UTC offset can start with
+_tzsigns = b"+-"
+
 
 @Dumper.text(date)
 class DateDumper(Dumper):
@@ -23,7 +109,7 @@ class DateDumper(Dumper):
     def dump(self, obj: date) -> bytes:
         # NOTE: whatever the PostgreSQL DateStyle input format (DMY, MDY, YMD)
         # the YYYY-MM-DD is always understood correctly.
-        return str(obj).encode("utf8")
+        return obj.isoformat().encode()
 
 
 @Dumper.text(time)
@@ -32,7 +118,7 @@ class TimeDumper(Dumper):
     oid = builtins["timetz"].oid
 
     def dump(self, obj: time) -> bytes:
-        return str(obj).encode("utf8")
+        return obj.isoformat().encode()
 
 
 @Dumper.text(datetime)
@@ -40,10 +126,10 @@ class DateTimeDumper(Dumper):
 
     oid = builtins["timestamptz"].oid
 
-    def dump(self, obj: date) -> bytes:
+    def dump(self, obj: datetime) -> bytes:
         # NOTE: whatever the PostgreSQL DateStyle input format (DMY, MDY, YMD)
         # the YYYY-MM-DD is always understood correctly.
-        return str(obj).encode("utf8")
+        return obj.isoformat(" ").encode()
 
 
 @Dumper.text(timedelta)
@@ -55,18 +141,20 @@ class TimeDeltaDumper(Dumper):
         super().__init__(src, context)
         if self.connection:
             if (
-                self.connection.pgconn.parameter_status(b"IntervalStyle")
+                self.connection._parameter_status(b"IntervalStyle")
                 == b"sql_standard"
             ):
                 setattr(self, "dump", self._dump_sql)
 
     def dump(self, obj: timedelta) -> bytes:
-        return str(obj).encode("utf8")
+        return str(obj).encode()
 
     def _dump_sql(self, obj: timedelta) -> bytes:
         # sql_standard format needs explicit signs
-        # otherwise -1 day 1 sec will mean -1 sec
-        return b"%+d day %+d second %+d microsecond" % (
+        # otherwise -1 day 1 sec will mean -1 sec.
+        # Seconds and microseconds are never negative in a timedelta, so
+        # their sign can be part of the format string.
+        return b"%+d day +%d second +%d microsecond" % (
             obj.days,
             obj.seconds,
             obj.microseconds,
@@ -75,33 +163,114 @@ class TimeDeltaDumper(Dumper):
 
 @Loader.text(builtins["date"].oid)
 class DateLoader(Loader):
+
+    # The formats of the DateStyles, by their first letter: (DMY, MDY/YMD),
+    # None if the DateStyle is not supported
+    _formats: Dict[bytes, Optional[Tuple[str, str]]] = {
+        b"I": ("%Y-%m-%d", "%Y-%m-%d"),  # ISO
+        b"G": ("%d.%m.%Y", "%d.%m.%Y"),  # German
+        b"S": ("%d/%m/%Y", "%m/%d/%Y"),  # SQL
+        b"P": ("%d-%m-%Y", "%m-%d-%Y"),  # Postgres
+    }
+
     def __init__(self, oid: int, context: AdaptContext):
         super().__init__(oid, context)
-        self._format = self._format_from_context()
+        ds = self._get_datestyle()
+        self._is_iso = ds.startswith(b"I")
+        fmts = self._format_from_datestyle(ds)
+        if not fmts:
+            setattr(self, "load", self._load_notimpl)
+            return
+
+        (
+            self._format,
+            self._format_no_micro,
+            self._re_format,
+            self._datesep,
+        ) = fmts
+        if self._is_iso:
+            setattr(self, "load", self._load_iso)
 
     def load(self, data: bytes) -> date:
+        m = self._re_format.match(data)
+        if not m:
+            return self._load_strptime(data)
+
+        ye, mo, da = m.group("Y", "m", "d")
         try:
-            return datetime.strptime(data.decode("utf8"), self._format).date()
+            return date(int(ye), int(mo), int(da))
         except ValueError as e:
             return self._raise_error(data, e)
 
-    def _format_from_context(self) -> str:
-        ds = self._get_datestyle()
-        if ds.startswith(b"I"):  # ISO
-            return "%Y-%m-%d"
-        elif ds.startswith(b"G"):  # German
-            return "%d.%m.%Y"
-        elif ds.startswith(b"S"):  # SQL
-            return "%d/%m/%Y" if ds.endswith(b"DMY") else "%m/%d/%Y"
-        elif ds.startswith(b"P"):  # Postgres
-            return "%d-%m-%Y" if ds.endswith(b"DMY") else "%m-%d-%Y"
-        else:
+    if sys.version_info >= (3, 7):
+
+        def _load_iso(self, data: bytes) -> date:
+            # Fast path for the ISO DateStyle: "YYYY-MM-DD" is parsed in C
+            try:
+                return date.fromisoformat(data.decode())
+            except ValueError:
+                # Let the slow path report the error
+                return DateLoader.load(self, data)
+
+    else:
+
+        def _load_iso(self, data: bytes) -> date:
+            # Fast path for the ISO DateStyle: the fields are at fixed
+            # positions in "YYYY-MM-DD", so convert the digits directly.
+            if len(data) != 10:
+                return DateLoader.load(self, data)
+            try:
+                return date(
+                    (data[0] - 48) * 1000
+                    + (data[1] - 48) * 100
+                    + (data[2] - 48) * 10
+                    + (data[3] - 48),
+                    (data[5] - 48) * 10 + (data[6] - 48),
+                    (data[8] - 48) * 10 + (data[9] - 48),
+                )
+            except ValueError:
+                # Let the slow path report the error
+                return DateLoader.load(self, data)
+
+    def _load_strptime(self, data: bytes) -> date:
+        # Slow path, only used for data not matching the regexp, e.g. BC dates
+        try:
+            return datetime.strptime(data.decode(), self._format).date()
+        except ValueError as e:
+            return self._raise_error(data, e)
+
+    def _load_notimpl(self, data: bytes) -> date:
+        raise NotImplementedError(
+            f"{type(self).__name__} can't parse data with DateStyle"
+            f" {self._get_datestyle().decode('ascii')}: {data.decode('ascii')}"
+        )
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _format_from_datestyle(
+        cls, ds: bytes
+    ) -> Optional[Tuple[str, str, Pattern[bytes], bytes]]:
+        try:
+            fmts = cls._formats[ds[:1]]
+        except KeyError:
             raise InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
 
+        if not fmts:
+            return None
+
+        dmy, other = fmts
+        fmt = dmy if ds.endswith(b"DMY") else other
+        return (
+            fmt,
+            fmt.replace(".%f", ""),
+            _re_from_format(fmt),
+            fmt[2:3].encode("ascii"),
+        )
+
     def _get_datestyle(self) -> bytes:
         rv = b"ISO, DMY"
         if self.connection:
-            ds = self.connection.pgconn.parameter_status(b"DateStyle")
+            ds = self.connection._parameter_status(b"DateStyle")
             if ds:
                 rv = ds
 
@@ -126,9 +295,12 @@ class DateLoader(Loader):
         raise exc
 
     def _get_year_digits(self, data: bytes) -> int:
-        datesep = self._format[2].encode("ascii")
-        parts = data.split(b" ")[0].split(datesep)
-        return max(map(len, parts))
+        # We only care to know if the year has more than 4 digits: stop at
+        # the first part longer than that, and don't split the time part.
+        for part in data.split(b" ", 1)[0].split(self._datesep):
+            if len(part) > 4:
+                return len(part)
+        return 4
 
 
 @Loader.text(builtins["time"].oid)
@@ -136,12 +308,26 @@ class TimeLoader(Loader):
 
     _format = "%H:%M:%S.%f"
     _format_no_micro = _format.replace(".%f", "")
+    _re_format = _re_from_format(_format)
 
     def load(self, data: bytes) -> time:
+        m = self._re_format.match(data)
+        if not m:
+            return self._load_strptime(data)
+
+        ho, mi, se, us = m.group("H", "M", "S", "f")
+        try:
+            return time(
+                int(ho), int(mi), int(se), int(us.ljust(6, b"0")) if us else 0
+            )
+        except ValueError as e:
+            return self._raise_error(data, e)
+
+    def _load_strptime(self, data: bytes) -> time:
         # check if the data contains microseconds
         fmt = self._format if b"." in data else self._format_no_micro
         try:
-            return datetime.strptime(data.decode("utf8"), fmt).time()
+            return datetime.strptime(data.decode(), fmt).time()
         except ValueError as e:
             return self._raise_error(data, e)
 
@@ -160,74 +346,119 @@ class TimeLoader(Loader):
 class TimeTzLoader(TimeLoader):
     _format = "%H:%M:%S.%f%z"
     _format_no_micro = _format.replace(".%f", "")
+    _re_format = _re_from_format(_format)
 
-    def __init__(self, oid: int, context: AdaptContext):
-        if sys.version_info < (3, 7):
-            setattr(self, "load", self._load_py36)
+    def load(self, data: bytes) -> time:
+        m = self._re_format.match(data)
+        if not m:
+            return self._load_strptime(data)
 
-        super().__init__(oid, context)
+        ho, mi, se, us, tz = m.group("H", "M", "S", "f", "z")
+        try:
+            return time(
+                int(ho),
+                int(mi),
+                int(se),
+                int(us.ljust(6, b"0")) if us else 0,
+                _timezone_from_offset(tz),
+            )
+        except ValueError as e:
+            return self._raise_error(data, e)
 
-    def load(self, data: bytes) -> time:
+    def _load_strptime(self, data: bytes) -> time:
         # Hack to convert +HH in +HHMM
-        if data[-3] in (43, 45):
+        if data[-3] in _tzsigns:
             data += b"00"
 
         fmt = self._format if b"." in data else self._format_no_micro
         try:
-            dt = datetime.strptime(data.decode("utf8"), fmt)
+            dt = datetime.strptime(data.decode(), fmt)
         except ValueError as e:
             return self._raise_error(data, e)
 
         return dt.time().replace(tzinfo=dt.tzinfo)
 
-    def _load_py36(self, data: bytes) -> time:
-        # Drop seconds from timezone for Python 3.6
-        # Also, Python 3.6 doesn't support HHMM, only HH:MM
-        if data[-6] in (43, 45):  # +-HH:MM -> +-HHMM
-            data = data[:-3] + data[-2:]
-        elif data[-9] in (43, 45):  # +-HH:MM:SS -> +-HHMM
-            data = data[:-6] + data[-5:-3]
-
-        return TimeTzLoader.load(self, data)
-
 
 @Loader.text(builtins["timestamp"].oid)
 class TimestampLoader(DateLoader):
-    def __init__(self, oid: int, context: AdaptContext):
-        super().__init__(oid, context)
-        self._format_no_micro = self._format.replace(".%f", "")
+
+    _formats = {
+        b"I": ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S.%f"),
+        b"G": ("%d.%m.%Y %H:%M:%S.%f", "%d.%m.%Y %H:%M:%S.%f"),
+        b"S": ("%d/%m/%Y %H:%M:%S.%f", "%m/%d/%Y %H:%M:%S.%f"),
+        b"P": ("%a %d %b %H:%M:%S.%f %Y", "%a %b %d %H:%M:%S.%f %Y"),
+    }
 
     def load(self, data: bytes) -> datetime:
+        m = self._re_format.match(data)
+        if not m:
+            return self._load_strptime(data)
+
+        # The month may be a number or a name, according to the DateStyle
+        ye, mo, da, ho, mi, se, us = m.group("Y", "m", "d", "H", "M", "S", "f")
+        try:
+            return datetime(
+                int(ye),
+                _month_ids[mo],
+                int(da),
+                int(ho),
+                int(mi),
+                int(se),
+                int(us.ljust(6, b"0")) if us else 0,
+            )
+        except ValueError as e:
+            return self._raise_error(data, e)
+
+    if sys.version_info >= (3, 11):
+
+        def _load_iso(self, data: bytes) -> datetime:
+            # Fast path for the ISO DateStyle, parsed in C. Before Python 3.11
+            # fromisoformat() doesn't parse the microseconds with the
+            # trailing zeros dropped.
+            try:
+                return datetime.fromisoformat(data.decode())
+            except ValueError:
+                # Let the slow path report the error
+                return TimestampLoader.load(self, data)
+
+    else:
+
+        def _load_iso(self, data: bytes) -> datetime:
+            # Fast path for the ISO DateStyle: "YYYY-MM-DD HH:MM:SS[.ffffff]"
+            try:
+                if len(data) == 19:
+                    us = 0
+                elif data[19] == 46:  # "."
+                    us = int(data[20:].ljust(6, b"0"))
+                else:
+                    return TimestampLoader.load(self, data)
+
+                return datetime(
+                    (data[0] - 48) * 1000
+                    + (data[1] - 48) * 100
+                    + (data[2] - 48) * 10
+                    + (data[3] - 48),
+                    (data[5] - 48) * 10 + (data[6] - 48),
+                    (data[8] - 48) * 10 + (data[9] - 48),
+                    (data[11] - 48) * 10 + (data[12] - 48),
+                    (data[14] - 48) * 10 + (data[15] - 48),
+                    (data[17] - 48) * 10 + (data[18] - 48),
+                    us,
+                )
+            except (ValueError, IndexError):
+                # Let the slow path report the error
+                return TimestampLoader.load(self, data)
+
+    def _load_strptime(self, data: bytes) -> datetime:
         # check if the data contains microseconds
         fmt = (
             self._format if data.find(b".", 19) >= 0 else self._format_no_micro
         )
         try:
-            return datetime.strptime(data.decode("utf8"), fmt)
+            return datetime.strptime(data.decode(), fmt)
         except ValueError as e:
             return self._raise_error(data, e)
 
-    def _format_from_context(self) -> str:
-        ds = self._get_datestyle()
-        if ds.startswith(b"I"):  # ISO
-            return "%Y-%m-%d %H:%M:%S.%f"
-        elif ds.startswith(b"G"):  # German
-            return "%d.%m.%Y %H:%M:%S.%f"
-        elif ds.startswith(b"S"):  # SQL
-            return (
-                "%d/%m/%Y %H:%M:%S.%f"
-                if ds.endswith(b"DMY")
-                else "%m/%d/%Y %H:%M:%S.%f"
-            )
-        elif ds.startswith(b"P"):  # Postgres
-            return (
-                "%a %d %b %H:%M:%S.%f %Y"
-                if ds.endswith(b"DMY")
-                else "%a %b %d %H:%M:%S.%f %Y"
-            )
-        else:
-            raise InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
-
     def _raise_error(self, data: bytes, exc: ValueError) -> datetime:
         return cast(datetime, super()._raise_error(data, exc))
 
@@ -236,7 +467,7 @@ class TimestampLoader(DateLoader):
         if not self._get_datestyle().startswith(b"P"):  # Postgres
             return super()._get_year_digits(data)
         else:
-            parts = data.split()
+            parts = data.split(None, 5)
             if len(parts) > 4:
                 return len(parts[4])
             else:
@@ -245,127 +476,201 @@ class TimestampLoader(DateLoader):
 
 @Loader.text(builtins["timestamptz"].oid)
 class TimestamptzLoader(TimestampLoader):
-    def __init__(self, oid: int, context: AdaptContext):
-        if sys.version_info < (3, 7):
-            setattr(self, "load", self._load_py36)
-
-        super().__init__(oid, context)
-
-    def _format_from_context(self) -> str:
-        ds = self._get_datestyle()
-        if ds.startswith(b"I"):  # ISO
-            return "%Y-%m-%d %H:%M:%S.%f%z"
 
+    _formats = {
+        b"I": ("%Y-%m-%d %H:%M:%S.%f%z", "%Y-%m-%d %H:%M:%S.%f%z"),
         # These don't work: the timezone name is not always displayed
-        # elif ds.startswith(b"G"):  # German
-        #     return "%d.%m.%Y %H:%M:%S.%f %Z"
-        # elif ds.startswith(b"S"):  # SQL
-        #     return (
-        #         "%d/%m/%Y %H:%M:%S.%f %Z"
-        #         if ds.endswith(b"DMY")
-        #         else "%m/%d/%Y %H:%M:%S.%f %Z"
-        #     )
-        # elif ds.startswith(b"P"):  # Postgres
-        #     return (
-        #         "%a %d %b %H:%M:%S.%f %Y %Z"
-        #         if ds.endswith(b"DMY")
-        #         else "%a %b %d %H:%M:%S.%f %Y %Z"
-        #     )
-        # else:
-        #     raise InterfaceError(f"unexpected DateStyle: {ds.decode('ascii')}")
-        else:
-            setattr(self, "load", self._load_notimpl)
-            return ""
+        # b"G": ("%d.%m.%Y %H:%M:%S.%f %Z", "%d.%m.%Y %H:%M:%S.%f %Z"),
+        # b"S": ("%d/%m/%Y %H:%M:%S.%f %Z", "%m/%d/%Y %H:%M:%S.%f %Z"),
+        # b"P": ("%a %d %b %H:%M:%S.%f %Y %Z", "%a %b %d %H:%M:%S.%f %Y %Z"),
+        b"G": None,
+        b"S": None,
+        b"P": None,
+    }
 
     def load(self, data: bytes) -> datetime:
-        # Hack to convert +HH in +HHMM
-        if data[-3] in (43, 45):
-            data += b"00"
+        m = self._re_format.match(data)
+        if not m:
+            return self._load_strptime(data)
+
+        ye, mo, da, ho, mi, se, us, tz = m.group(
+            "Y", "m", "d", "H", "M", "S", "f", "z"
+        )
+        try:
+            return datetime(
+                int(ye),
+                int(mo),
+                int(da),
+                int(ho),
+                int(mi),
+                int(se),
+                int(us.ljust(6, b"0")) if us else 0,
+                _timezone_from_offset(tz),
+            )
+        except ValueError as e:
+            return self._raise_error(data, e)
 
-        return super().load(data)
+    def _load_iso_bytes(self, data: bytes) -> datetime:
+        # Fast path for the ISO DateStyle: "YYYY-MM-DD HH:MM:SS[.ffffff]+TZ"
+        # parsed without fromisoformat(), used on Python < 3.11.
+        try:
+            if data[19] == 46:  # "."
+                tzpos = max(data.find(b"+", 20), data.find(b"-", 20))
+                us = int(data[20:tzpos].ljust(6, b"0"))
+            else:
+                tzpos = 19
+                us = 0
+
+            return datetime(
+                (data[0] - 48) * 1000
+                + (data[1] - 48) * 100
+                + (data[2] - 48) * 10
+                + (data[3] - 48),
+                (data[5] - 48) * 10 + (data[6] - 48),
+                (data[8] - 48) * 10 + (data[9] - 48),
+                (data[11] - 48) * 10 + (data[12] - 48),
+                (data[14] - 48) * 10 + (data[15] - 48),
+                (data[17] - 48) * 10 + (data[18] - 48),
+                us,
+                _timezone_from_offset(data[tzpos:]),
+            )
+        except (ValueError, IndexError):
+            # Let the slow path report the error
+            return TimestamptzLoader.load(self, data)
 
-    def _load_py36(self, data: bytes) -> datetime:
-        # Drop seconds from timezone for Python 3.6
-        # Also, Python 3.6 doesn't support HHMM, only HH:MM
-        tzsep = (43, 45)  # + and - bytes
-        if data[-3] in tzsep:  # +HH, -HH
-            data += b"00"
-        elif data[-6] in tzsep:
-            data = data[:-3] + data[-2:]
-        elif data[-9] in tzsep:
-            data = data[:-6] + data[-5:-3]
+    if sys.version_info >= (3, 11):
 
-        return super().load(data)
+        def _load_iso(self, data: bytes) -> datetime:
+            # Fast path for the ISO DateStyle, parsed in C. Before Python 3.11
+            # fromisoformat() doesn't parse the +HH offsets and the
+            # microseconds with the trailing zeros dropped.
+            try:
+                return datetime.fromisoformat(data.decode())
+            except ValueError:
+                # Let the slow path report the error
+                return TimestamptzLoader.load(self, data)
 
-    def _load_notimpl(self, data: bytes) -> datetime:
-        raise NotImplementedError(
-            "can't parse datetimetz with DateStyle"
-            f" {self._get_datestyle().decode('ascii')}: {data.decode('ascii')}"
-        )
+    else:
+
+        _load_iso = _load_iso_bytes
+
+    def _load_strptime(self, data: bytes) -> datetime:
+        # Hack to convert +HH in +HHMM
+        if data[-3] in _tzsigns:
+            data += b"00"
+
+        return super()._load_strptime(data)
 
 
 @Loader.text(builtins["interval"].oid)
 class IntervalLoader(Loader):
 
+    # Match the output of the 'postgres' IntervalStyle, e.g.
+    # "1 year 2 mons -3 days +04:05:06.7". Anchored at the end, so that a
+    # mismatch is detected as soon as possible.
     _re_interval = re.compile(
-        br"""
-        (?: (?P<years> [-+]?\d+) \s+ years? \s* )?
-        (?: (?P<months> [-+]?\d+) \s+ mons? \s* )?
-        (?: (?P<days> [-+]?\d+) \s+ days? \s* )?
-        (?: (?P<hsign> [-+])?
-            (?P<hours> \d+ )
-          : (?P<minutes> \d+ )
-          : (?P<seconds> \d+ (?:\.\d+)? )
-        )?
-        """,
-        re.VERBOSE,
+        br"(?!$)"  # at least one of the fields below
+        br"(?:(?P<years>[-+]?\d+) years? ?)?"
+        br"(?:(?P<months>[-+]?\d+) mons? ?)?"
+        br"(?:(?P<days>[-+]?\d+) days? ?)?"
+        br"(?:(?P<hsign>[-+])?"
+        br"(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+)"
+        br"(?:\.(?P<micros>\d{1,6}))?)?"
+        br"$"
     )
 
     def __init__(self, oid: int, context: AdaptContext):
         super().__init__(oid, context)
         if self.connection:
-            ints = self.connection.pgconn.parameter_status(b"IntervalStyle")
+            ints = self.connection._parameter_status(b"IntervalStyle")
             if ints != b"postgres":
                 setattr(self, "load", self._load_notimpl)
 
-    def load(self, data: bytes) -> timedelta:
-        m = self._re_interval.match(data)
+    # The functions used in the load methods are bound as default arguments:
+    # local variables are faster to access than globals and builtins.
+    # The seconds are computed as int, together with the microseconds, which
+    # is faster than going through float and has no rounding.
+
+    def load(
+        self,
+        data: bytes,
+        __match: Callable[[bytes], Optional[Match[bytes]]] = (
+            _re_interval.match
+        ),
+        __int: Type[int] = int,
+        __timedelta: Type[timedelta] = timedelta,
+    ) -> timedelta:
+        if b" " not in data:
+            # Only the time part (e.g. "-01:02:03.4"): no need for the regexp
+            try:
+                return self._load_time(data)
+            except ValueError:
+                pass
+
+        m = __match(data)
         if not m:
-            raise ValueError("can't parse interval: {data.decode('ascii')}")
-
-        days = 0
-        seconds = 0.0
+            raise ValueError(f"can't parse interval: {data.decode('ascii')}")
+
+        (
+            years,
+            months,
+            days,
+            hsign,
+            hours,
+            minutes,
+            seconds,
+            micros,
+        ) = m.groups()
+        ndays = nsecs = nmicros = 0
+
+        if years:
+            ndays += 365 * __int(years)
+
+        if months:
+            ndays += 30 * __int(months)
+
+        if days:
+            ndays += __int(days)
+
+        if hours:
+            nsecs = 3600 * __int(hours) + 60 * __int(minutes) + __int(seconds)
+            if micros:
+                nmicros = __int(micros.ljust(6, b"0"))
+            if hsign == b"-":
+                nsecs = -nsecs
+                nmicros = -nmicros
 
-        tmp = m.group("years")
-        if tmp:
-            days += 365 * int(tmp)
-
-        tmp = m.group("months")
-        if tmp:
-            days += 30 * int(tmp)
-
-        tmp = m.group("days")
-        if tmp:
-            days += int(tmp)
+        try:
+            return __timedelta(ndays, nsecs, nmicros)
+        except OverflowError as e:
+            raise DataError(str(e))
 
-        if m.group("hours"):
-            seconds = (
-                3600 * int(m.group("hours"))
-                + 60 * int(m.group("minutes"))
-                + float(m.group("seconds"))
-            )
-            if m.group("hsign") == b"-":
-                seconds = -seconds
+    def _load_time(
+        self,
+        data: bytes,
+        __int: Type[int] = int,
+        __timedelta: Type[timedelta] = timedelta,
+    ) -> timedelta:
+        neg = data.startswith(b"-")
+        hours, minutes, seconds = data.lstrip(b"-+").split(b":")
+        seconds, _, micros = seconds.partition(b".")
+        if len(micros) > 6:
+            raise ValueError("too many digits in the fractional seconds")
+        secs = 3600 * __int(hours) + 60 * __int(minutes) + __int(seconds)
+        us = __int(micros.ljust(6, b"0")) if micros else 0
+        if neg:
+            secs = -secs
+            us = -us
 
         try:
-            return timedelta(days=days, seconds=seconds)
+            return __timedelta(0, secs, us)
         except OverflowError as e:
             raise DataError(str(e))
 
     def _load_notimpl(self, data: bytes) -> timedelta:
         ints = (
             self.connection
-            and self.connection.pgconn.parameter_status(b"IntervalStyle")
+            and self.connection._parameter_status(b"IntervalStyle")
             or b"unknown"
         )
         raise NotImplementedError(
@@ -7,6 +7,7 @@ if a compiler is available.
 
 # Copyright (C) 2020 The Psycopg Team
 
+include "types/date.pyx"
 include "types/numeric.pyx"
 include "types/text.pyx"
 include "generators.pyx"
@@ -80,5 +80,6 @@ def register_builtin_c_loaders():
 
     """
     logger.debug("registering optimised c loaders")
+    register_date_c_loaders()
     register_numeric_c_loaders()
     register_text_c_loaders()
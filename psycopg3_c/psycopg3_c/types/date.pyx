@@ -0,0 +1,123 @@
+"""
+Cython adapters for date/time types.
+"""
+
+# Copyright (C) 2020 The Psycopg Team
+
+from cpython.datetime cimport import_datetime, date_new, datetime_new
+
+import_datetime()
+
+
+cdef int parse_digits(const char *data, int ndigits):
+    """
+    Return the number represented by the first `ndigits` chars of `data`.
+
+    Return -1 if any of the chars is not a digit.
+    """
+    cdef int rv = 0
+    cdef int i
+    for i in range(ndigits):
+        if not c'0' <= data[i] <= c'9':
+            return -1
+        rv = rv * 10 + (data[i] - c'0')
+
+    return rv
+
+
+cdef class DateLoader(CLoader):
+    cdef bint is_iso
+    cdef object pyloader
+
+    def __init__(self, oid: int, context: "AdaptContext" = None):
+        from psycopg3.types.date import DateLoader
+
+        super().__init__(oid, context)
+
+        # Parse in C the ISO DateStyle only. The Python loader deals with the
+        # other styles and with the values we don't know how to handle.
+        self.pyloader = DateLoader(oid, context)
+        self.is_iso = self.pyloader._is_iso
+
+    cdef object cload(self, const char *data, size_t length):
+        cdef int y, m, d
+        if (
+            self.is_iso and length == 10
+            and data[4] == c'-' and data[7] == c'-'
+        ):
+            # YYYY-MM-DD
+            y = parse_digits(data, 4)
+            m = parse_digits(data + 5, 2)
+            d = parse_digits(data + 8, 2)
+            if y >= 0 and m >= 0 and d >= 0:
+                try:
+                    return date_new(y, m, d)
+                except ValueError:
+                    pass
+
+        return self.pyloader.load(data[:length])
+
+
+cdef class TimestampLoader(CLoader):
+    cdef bint is_iso
+    cdef object pyloader
+
+    def __init__(self, oid: int, context: "AdaptContext" = None):
+        from psycopg3.types.date import TimestampLoader
+
+        super().__init__(oid, context)
+
+        self.pyloader = TimestampLoader(oid, context)
+        self.is_iso = self.pyloader._is_iso
+
+    cdef object cload(self, const char *data, size_t length):
+        if self.is_iso and 19 <= length <= 26:
+            rv = self._cload_iso(data, length)
+            if rv is not None:
+                return rv
+
+        return self.pyloader.load(data[:length])
+
+    cdef object _cload_iso(self, const char *data, size_t length):
+        # YYYY-MM-DD HH:MM:SS[.ffffff], return None if not matching
+        if not (
+            data[4] == c'-' and data[7] == c'-' and data[10] == c' '
+            and data[13] == c':' and data[16] == c':'
+        ):
+            return None
+
+        cdef int y = parse_digits(data, 4)
+        cdef int m = parse_digits(data + 5, 2)
+        cdef int d = parse_digits(data + 8, 2)
+        cdef int hh = parse_digits(data + 11, 2)
+        cdef int mm = parse_digits(data + 14, 2)
+        cdef int ss = parse_digits(data + 17, 2)
+        if y < 0 or m < 0 or d < 0 or hh < 0 or mm < 0 or ss < 0:
+            return None
+
+        # Microseconds are printed without the trailing zeros
+        cdef int us = 0
+        cdef int ndigits = length - 20
+        cdef int i
+        if length > 19:
+            if data[19] != c'.' or ndigits < 1:
+                return None
+            us = parse_digits(data + 20, ndigits)
+            if us < 0:
+                return None
+            for i in range(6 - ndigits):
+                us *= 10
+
+        try:
+            return datetime_new(y, m, d, hh, mm, ss, us, None)
+        except ValueError:
+            return None
+
+
+cdef void register_date_c_loaders():
+    logger.debug("registering optimised date c loaders")
+
+    from psycopg3.oids import builtins
+
+    DateLoader.register(builtins["date"].oid)
+    TimestampLoader.register(builtins["timestamp"].oid)
@@ -5,6 +5,8 @@ import pytest
 
 from psycopg3 import DataError, sql
 from psycopg3.adapt import Format
+from psycopg3.oids import builtins
+from psycopg3.types.date import IntervalLoader, TimestamptzLoader
 
 
 #
@@ -84,6 +86,16 @@ def test_load_date_datestyle(conn, datestyle_out):
     assert cur.fetchone()[0] == dt.date(2000, 1, 2)
 
 
+def test_load_date_datestyle_rollback(conn):
+    cur = conn.cursor()
+    cur.execute("set datestyle = German, YMD")
+    cur.execute("select '2000-01-02'::date")
+    assert cur.fetchone()[0] == dt.date(2000, 1, 2)
+    conn.rollback()
+    cur.execute("select '2000-01-02'::date")
+    assert cur.fetchone()[0] == dt.date(2000, 1, 2)
+
+
 @pytest.mark.parametrize("val", ["min", "max"])
 @pytest.mark.parametrize("datestyle_out", ["ISO", "Postgres", "SQL", "German"])
 def test_load_date_overflow(conn, val, datestyle_out):
@@ -151,6 +163,7 @@ def test_dump_datetime_datestyle(conn, datestyle_in):
         ("2000,1,2,3,4,5,6", "2000-01-02 03:04:05.000006"),
         ("2000,1,2,3,4,5,678", "2000-01-02 03:04:05.000678"),
         ("2000,1,2,3,0,0,456789", "2000-01-02 03:00:00.456789"),
+        ("2000,1,2,3,4,5,600000", "2000-01-02 03:04:05.6"),
         ("2000,12,31", "2000-12-31"),
         ("3000,1,1", "3000-01-01"),
         ("max", "9999-12-31 23:59:59.999999"),
@@ -166,6 +179,24 @@ def test_load_datetime(conn, val, expr, datestyle_in, datestyle_out):
     assert cur.fetchone()[0] == as_dt(val)
 
 
+@pytest.mark.parametrize("micro", ["", ".5"])
+def test_load_datetime_mixed_micro(conn, micro):
+    cur = conn.cursor()
+    cur.execute("set datestyle = ISO, YMD")
+    cur.execute(
+        "select '2000-01-01'::timestamp + x * '1 second'::interval"
+        " from generate_series(1, 20) x"
+        f" union all select '2000-01-02 03:04:05{micro}'::timestamp"
+        " union all select '2000-01-02 03:04:06'::timestamp"
+    )
+    recs = [r[0] for r in cur]
+    assert recs[:20] == [
+        dt.datetime(2000, 1, 1, 0, 0, i) for i in range(1, 21)
+    ]
+    assert recs[20] == dt.datetime(2000, 1, 2, 3, 4, 5, 500000 if micro else 0)
+    assert recs[21] == dt.datetime(2000, 1, 2, 3, 4, 6)
+
+
 @pytest.mark.parametrize("val", ["min", "max"])
 @pytest.mark.parametrize("datestyle_out", ["ISO", "Postgres", "SQL", "German"])
 def test_load_datetime_overflow(conn, val, datestyle_out):
@@ -258,6 +289,26 @@ def test_load_datetimetz(conn, val, expr, timezone, datestyle_out):
     assert cur.fetchone()[0] == as_dt(val)
 
 
+@pytest.mark.parametrize("iso_bytes", [False, True])
+@pytest.mark.parametrize(
+    "expr", ["2000-01-01 00:00:00 BC", "2000-01-01 00:00:00.5 BC"]
+)
+@pytest.mark.parametrize("timezone", ["Europe/Amsterdam", "America/New_York"])
+def test_load_datetimetz_bc(conn, monkeypatch, expr, timezone, iso_bytes):
+    # BC timestamps in these time zones have an offset with seconds
+    if iso_bytes:
+        # Test the ISO parser used before Python 3.11 too
+        monkeypatch.setattr(
+            TimestamptzLoader, "_load_iso", TimestamptzLoader._load_iso_bytes
+        )
+    cur = conn.cursor()
+    cur.execute("set datestyle = ISO, DMY")
+    cur.execute(f"set timezone to '{timezone}'")
+    cur.execute(f"select '{expr}'::timestamptz")
+    with pytest.raises(DataError):
+        cur.fetchone()[0]
+
+
 @pytest.mark.xfail  # parse timezone names
 @pytest.mark.parametrize("val, expr", [("2000,1,1~2", "2000-01-01")])
 @pytest.mark.parametrize("datestyle_out", ["SQL", "Postgres", "German"])
@@ -305,6 +356,7 @@ def test_dump_time_binary(conn, val, expr):
         ("10,20", "10:20"),
         ("10,20,30", "10:20:30"),
         ("10,20,30,40", "10:20:30.000040"),
+        ("10,20,30,500000", "10:20:30.5"),
         ("max", "23:59:59.999999"),
     ],
 )
@@ -447,7 +499,10 @@ def test_dump_interval_binary(conn, val, expr):
         ("-86399s,-999999m", "-23:59:59.999999"),
         ("-3723s,-400000m", "-1:2:3.4"),
         ("3723s,400000m", "1:2:3.4"),
+        ("-1s,500000m", "-0.5 sec"),
         ("86399s,999999m", "23:59:59.999999"),
+        ("7200000000000s,1m", "2000000000 hour 0.000001 sec"),
+        ("-1d,-7200000000000s,-1m", "-1 day -2000000000 hour -0.000001 sec"),
         ("30d", "30 day"),
         ("365d", "1 year"),
         ("-365d", "-1 year"),
@@ -489,6 +544,15 @@ def test_load_interval_overflow(conn, val):
         cur.fetchone()[0]
 
 
+@pytest.mark.parametrize(
+    "data", [b"", b"1:2:3.1234567", b"1 day 1:2:3.1234567", b"1 week"]
+)
+def test_load_interval_error(conn, data):
+    loader = IntervalLoader(builtins["interval"].oid, conn)
+    with pytest.raises(ValueError, match="can't parse interval"):
+        loader.load(data)
+
+
 #
 # Support
 #